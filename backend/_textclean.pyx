@@ -0,0 +1,90 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled version of the text pass in scraper.clean_text_content.
+
+Build in place with:  cythonize -i _textclean.pyx
+When the extension is not built, scraper uses its regex implementation.
+"""
+
+cdef extern from "Python.h":
+    int PyUnicode_KIND(object o)
+    void *PyUnicode_DATA(object o)
+    Py_UCS4 PyUnicode_READ(int kind, void *data, Py_ssize_t index)
+
+
+cpdef str clean(str text, tuple phrases):
+    """
+    Remove citation markers and boilerplate phrases, then normalize whitespace.
+
+    Args:
+        text (str): Text extracted from the article
+        phrases (tuple): Lowercase boilerplate prefixes, matched ignoring ASCII case
+            only; each match is removed up to (not including) the next newline or
+            period, or the end of text
+
+    Returns:
+        str: Cleaned text, identical to the regex implementation's output
+    """
+    cdef Py_ssize_t i, j, k, m, n, start, end, plen
+    cdef Py_UCS4 c
+    cdef int kind
+    cdef void *data
+    cdef list parts = []
+    cdef str phrase
+    cdef str first_chars = ''.join([phrase[0] for phrase in phrases if phrase])
+    first_chars += first_chars.upper()
+
+    # Citation markers like [1] or [citation needed]: '[' up to the first ']'
+    start = 0
+    j = text.find('[')
+    while j != -1:
+        k = text.find(']', j + 1)
+        if k == -1:
+            break
+        parts.append(text[start:j])
+        start = k + 1
+        j = text.find('[', start)
+    parts.append(text[start:])
+    text = ''.join(parts)
+
+    # Boilerplate phrases, found with a typed scan that only compares at candidate first letters
+    parts = []
+    n = len(text)
+    kind = PyUnicode_KIND(text)
+    data = PyUnicode_DATA(text)
+    start = 0
+    i = 0
+    while i < n:
+        c = PyUnicode_READ(kind, data, i)
+        if c in first_chars:
+            end = -1
+            for phrase in phrases:
+                plen = len(phrase)
+                if plen == 0 or i + plen > n:
+                    continue
+                m = 0
+                while m < plen:
+                    c = PyUnicode_READ(kind, data, i + m)
+                    if u'A' <= c <= u'Z':
+                        c = <Py_UCS4>(<int>c + 32)
+                    if c != phrase[m]:
+                        break
+                    m += 1
+                if m == plen:
+                    end = n
+                    for k in range(i + plen, n):
+                        c = PyUnicode_READ(kind, data, k)
+                        if c == u'\n' or c == u'.':
+                            end = k
+                            break
+                    break
+            if end != -1:
+                parts.append(text[start:i])
+                start = end
+                i = end
+                continue
+        i += 1
+    parts.append(text[start:])
+
+    # str.split drops leading/trailing whitespace and collapses runs in C
+    return ' '.join(''.join(parts).split())
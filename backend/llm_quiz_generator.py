@@ -1,18 +1,25 @@
 import os
+import re
 import json
+import random
+import asyncio
 import logging
-import time
-from typing import Dict, Any, Optional
+import hashlib
+import threading
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, Optional, Tuple, Union
 from dotenv import load_dotenv
+from aiolimiter import AsyncLimiter
 
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
+from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
+from langchain_core.outputs import Generation
 from langchain_core.exceptions import OutputParserException
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.runnables import RunnablePassthrough
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from models import QuizResponse, LLMQuizRequest
+from models import QuizQuestion, QuizResponse, LLMQuizRequest
 
 # Load environment variables
 load_dotenv()
@@ -22,55 +29,109 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class LLMQuizGenerator:
+# Gemini models: the main model generates quizzes, the cheaper one repairs malformed JSON
+MODEL_NAME = "gemini-2.5-pro"
+REPAIR_MODEL_NAME = "gemini-2.5-flash"
+
+# Caps on concurrent Gemini calls and on requests per minute, so bursts queue
+# here instead of turning into 429s and retries
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))
+_GEMINI_SEM = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+_GEMINI_RATE_LIMITER = AsyncLimiter(GEMINI_REQUESTS_PER_MINUTE, 60)
+
+# Output budget for the JSON itself: a 5-10 question quiz fits comfortably in the
+# default, and a single escalation is allowed when output is cut short. Models
+# that think get THINKING_BUDGET added on top, since thinking counts as output.
+DEFAULT_MAX_OUTPUT_TOKENS = 1800
+ESCALATED_MAX_OUTPUT_TOKENS = 3000
+THINKING_BUDGET = 512
+
+# Content budget sent to the model (roughly 6k tokens)
+MAX_CONTENT_CHARS = 24_000
+
+# Target size of the pseudo-sections built from whitespace-normalised text
+_SECTION_BLOCK_CHARS = 1_500
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sections(content: str):
+    """Split content into sections and return them with the separator to rejoin them."""
+    sections = [section.strip() for section in content.split("\n\n") if section.strip()]
+    if len(sections) > 1:
+        return sections, "\n\n"
     
-    def __init__(self):
-        """Initialize the LLM quiz generator with Gemini API."""
-        self.api_key = self._get_api_key()
-        self.model = self._initialize_model()
-        self.output_parser = JsonOutputParser(pydantic_object=QuizResponse)
-        self.prompt_template = self._create_prompt_template()
-        self.chain = None
-        
-    def _get_api_key(self) -> str:
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_API_KEY environment variable is required. "
-                "Please set it in your .env file or environment."
-            )
-        return api_key
+    # Scraped text has its whitespace collapsed, so group sentences into blocks instead
+    blocks, current, size = [], [], 0
+    for sentence in _SENTENCE_BOUNDARY_RE.split(content):
+        current.append(sentence)
+        size += len(sentence) + 1
+        if size >= _SECTION_BLOCK_CHARS:
+            blocks.append(" ".join(current))
+            current, size = [], 0
+    if current:
+        blocks.append(" ".join(current))
+    return blocks, " "
+
+
+def truncate_content(content: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
+    """
+    Trim article content to a character budget, keeping its most useful sections.
     
-    def _initialize_model(self) -> ChatGoogleGenerativeAI:
-        """
-        Returns:
-            ChatGoogleGenerativeAI: Configured Gemini model instance
-        """
-        try:
-            model = ChatGoogleGenerativeAI(
-                model="gemini-2.5-pro",
-                google_api_key=self.api_key,
-                temperature=0.3,  # Lower temperature for more consistent output
-                max_output_tokens=4096,  # Sufficient for comprehensive quiz data
-                convert_system_message_to_human=True  # Required for Gemini
-            )
-            logger.info("Gemini model initialized successfully")
-            return model
-        except Exception as e:
-            logger.error(f"Failed to initialize Gemini model: {str(e)}")
-            raise
+    The lead section is always kept. The remaining budget goes to the
+    longest sections, with later sections weighted down, and the chosen
+    sections are returned in their original order.
+    """
+    if len(content) <= max_chars:
+        return content
     
-    def _create_prompt_template(self) -> PromptTemplate:
-        """
-        Create the comprehensive prompt template for quiz generation.
-        
-        The prompt is designed to ensure high-quality, grounded quiz generation
-        that prevents hallucination and enforces structure.
-        
-        Returns:
-            PromptTemplate: The configured prompt template
-        """
-        template = """You are an expert educational content creator specializing in transforming Wikipedia articles into comprehensive, structured quizzes. Your task is to analyze the provided article and generate educational content that is entirely grounded in the source material.
+    sections, separator = _split_sections(content)
+    lead = sections[0]
+    if len(lead) >= max_chars:
+        return lead[:max_chars].rsplit(" ", 1)[0]
+    
+    count = len(sections)
+    ranked = sorted(
+        range(1, count),
+        key=lambda i: len(sections[i]) * (1 - 0.5 * i / count),
+        reverse=True
+    )
+    
+    budget = max_chars - len(lead)
+    selected = []
+    for i in ranked:
+        cost = len(sections[i]) + len(separator)
+        if cost <= budget:
+            selected.append(i)
+            budget -= cost
+    
+    return separator.join([lead] + [sections[i] for i in sorted(selected)])
+
+
+# The parser, its format instructions and the prompt template do not depend on
+# the request or the API key, so they are built once at import time.
+_OUTPUT_PARSER = JsonOutputParser(pydantic_object=QuizResponse)
+_FORMAT_INSTRUCTIONS = _OUTPUT_PARSER.get_format_instructions()
+
+_JSON_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.DOTALL)
+
+
+def parse_json_output(text: str) -> Any:
+    """
+    Parse complete model output, decoding well-formed JSON with orjson.
+    
+    Anything orjson rejects goes through the lenient LangChain parser, which
+    raises OutputParserException carrying the raw output when it also fails.
+    """
+    match = _JSON_FENCE_RE.match(text)
+    try:
+        return orjson.loads(match.group(1) if match else text)
+    except orjson.JSONDecodeError:
+        return _OUTPUT_PARSER.parse(text)
+
+# Prompt designed to keep quiz generation grounded in the article and to
+# enforce the JSON structure expected by QuizResponse.
+_QUIZ_PROMPT_TEMPLATE = """You are an expert educational content creator specializing in transforming Wikipedia articles into comprehensive, structured quizzes. Your task is to analyze the provided article and generate educational content that is entirely grounded in the source material.
 
 ARTICLE INFORMATION:
 Title: {title}
@@ -126,28 +187,117 @@ QUALITY STANDARDS:
 {format_instructions}
 
 Generate the response in the exact JSON format specified above. Ensure all fields are properly filled and the structure matches the requirements exactly."""
+
+# Prompt for re-emitting malformed model output as valid JSON
+_REPAIR_PROMPT = ChatPromptTemplate.from_messages([
+    HumanMessagePromptTemplate.from_template("""The following output was meant to be JSON in the format described below, but it could not be parsed.
+
+{format_instructions}
+
+OUTPUT:
+{completion}
+
+ERROR:
+{error}
+
+Return only the corrected JSON. Do not add, remove, or rewrite any content.""")
+]).partial(format_instructions=_FORMAT_INSTRUCTIONS)
+
+# Validator for LLM output, compiled once and reused for every generation
+_QUIZ_ADAPTER = TypeAdapter(QuizResponse)
+
+# A single human message, so no system-message conversion is needed for Gemini
+_PROMPT = ChatPromptTemplate.from_messages([
+    HumanMessagePromptTemplate.from_template(_QUIZ_PROMPT_TEMPLATE)
+]).partial(format_instructions=_FORMAT_INSTRUCTIONS)
+
+
+class LLMQuizGenerator:
+    
+    def __init__(self):
+        """Initialize the LLM quiz generator with Gemini API."""
+        self.api_key = self._get_api_key()
+        self.model = self._initialize_model()
+        self.output_parser = _OUTPUT_PARSER
+        self.prompt_template = _PROMPT
+        # The chain yields raw text so output can be streamed and parsed incrementally
+        self.chain = self.prompt_template | self.model | StrOutputParser()
+        self.escalated_chain = None
+        self.repair_chain = None
         
-        return PromptTemplate(
-            template=template,
-            input_variables=["title", "content"],
-            partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
-        )
+    def _get_api_key(self) -> str:
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "GOOGLE_API_KEY environment variable is required. "
+                "Please set it in your .env file or environment."
+            )
+        return api_key
+    
+    def _initialize_model(
+        self,
+        max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS,
+        model_name: str = MODEL_NAME
+    ) -> ChatGoogleGenerativeAI:
+        """
+        Args:
+            max_output_tokens (int): Cap on generated answer tokens, excluding thinking
+            model_name (str): Gemini model to use
+            
+        Returns:
+            ChatGoogleGenerativeAI: Configured Gemini model instance
+        """
+        try:
+            model_kwargs = {}
+            if "thinking_budget" in ChatGoogleGenerativeAI.model_fields:
+                # Thinking tokens count against the output budget, so reserve room for
+                # them instead of letting them eat into the JSON answer
+                model_kwargs["thinking_budget"] = THINKING_BUDGET
+                max_output_tokens += THINKING_BUDGET
+            
+            model = ChatGoogleGenerativeAI(
+                model=model_name,
+                google_api_key=self.api_key,
+                temperature=0.3,  # Lower temperature for more consistent output
+                max_output_tokens=max_output_tokens,
+                **model_kwargs
+            )
+            logger.info(f"Gemini model {model_name} initialized successfully")
+            return model
+        except Exception as e:
+            logger.error(f"Failed to initialize Gemini model: {str(e)}")
+            raise
     
     def get_chain(self):
         """
-        Get or create the LangChain processing chain.
+        Get the LangChain processing chain.
         
-        Creates a chain that combines prompt template, model, and JSON parser
-        with proper input formatting.
+        The chain combining prompt template and model is built once when the
+        generator is created and streams raw text; see stream_quiz_data.
         """
-        if self.chain is None:
-            self.chain = (
-                self.prompt_template
-                | self.model
-                | self.output_parser
-            )
         return self.chain
     
+    def get_escalated_chain(self):
+        """
+        Get the chain with a larger output budget, used once output gets cut short.
+        """
+        if self.escalated_chain is None:
+            model = self._initialize_model(max_output_tokens=ESCALATED_MAX_OUTPUT_TOKENS)
+            self.escalated_chain = self.prompt_template | model | StrOutputParser()
+        return self.escalated_chain
+    
+    def get_repair_chain(self):
+        """
+        Get the chain that asks the cheaper model to fix malformed JSON output.
+        """
+        if self.repair_chain is None:
+            model = self._initialize_model(
+                max_output_tokens=ESCALATED_MAX_OUTPUT_TOKENS,
+                model_name=REPAIR_MODEL_NAME
+            )
+            self.repair_chain = _REPAIR_PROMPT | model | self.output_parser
+        return self.repair_chain
+    
     def validate_environment(self) -> Dict[str, Any]:
         validation_results = {
             "api_key_configured": bool(self.api_key),
@@ -159,6 +309,103 @@ Generate the response in the exact JSON format specified above. Ensure all field
         logger.info(f"Environment validation: {validation_results}")
         return validation_results
     
+    def _prepare_input(self, title: str, content: str) -> Dict[str, str]:
+        """
+        Validate the article and build the prompt input.
+        
+        Raises:
+            ValueError: If the title is empty or the content is too short
+        """
+        if not title or not title.strip():
+            raise ValueError("Article title cannot be empty")
+        
+        if not content or len(content.strip()) < 500:
+            raise ValueError("Article content too short for quiz generation (minimum 500 characters)")
+        
+        # Cap the article size to bound token cost and latency
+        content = content.strip()
+        truncated_content = truncate_content(content)
+        if len(truncated_content) < len(content):
+            logger.info(f"Truncated article content from {len(content)} to {len(truncated_content)} characters")
+        
+        return {
+            "title": title.strip(),
+            "content": truncated_content
+        }
+    
+    async def stream_quiz_data(
+        self, input_data: Dict[str, str], chain=None, partial: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream progressively more complete quiz dicts as the model emits tokens.
+        
+        The last item yielded is the strictly parsed final output. With
+        partial=False only that final item is produced, skipping the
+        re-parse of the accumulated text on every chunk.
+        
+        Raises:
+            OutputParserException: If the complete output is not valid JSON
+        """
+        chunks = []
+        async with _GEMINI_SEM, _GEMINI_RATE_LIMITER:
+            async for chunk in (chain or self.get_chain()).astream(input_data):
+                chunks.append(chunk)
+                if not partial:
+                    continue
+                partial_result = self.output_parser.parse_result([Generation(text="".join(chunks))], partial=True)
+                if partial_result:
+                    yield partial_result
+        
+        yield parse_json_output("".join(chunks))
+    
+    async def stream_quiz(self, title: str, content: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream partial quiz data for an article without retries or validation.
+        
+        Useful for progressive display; use generate_quiz for a validated result.
+        """
+        async for partial in self.stream_quiz_data(self._prepare_input(title, content)):
+            yield partial
+    
+    def _build_quiz_response(self, result: Any) -> QuizResponse:
+        """
+        Validate parsed model output into a QuizResponse.
+        
+        Raises:
+            ValueError: If the output is not a JSON object
+            ValidationError: If the output does not match the quiz schema
+        """
+        if not isinstance(result, dict):
+            raise ValueError(f"Expected dict result, got {type(result)}")
+        
+        # Ignore any url the model produced (it is set by the calling function)
+        quiz_data = {k: v for k, v in result.items() if k != "url"}
+        quiz_data["url"] = ""
+        return _QUIZ_ADAPTER.validate_python(quiz_data)
+    
+    async def _repair_output(self, error: OutputParserException) -> Optional[QuizResponse]:
+        """
+        Try to salvage unparseable output with a single pass of the repair model.
+        
+        Returns:
+            Optional[QuizResponse]: The repaired quiz, or None if repair failed
+        """
+        if not error.llm_output:
+            return None
+        
+        try:
+            async with _GEMINI_SEM, _GEMINI_RATE_LIMITER:
+                result = await self.get_repair_chain().ainvoke({
+                    "completion": error.llm_output,
+                    "error": str(error)
+                })
+            quiz_response = self._build_quiz_response(result)
+            logger.info("Malformed output repaired successfully")
+            return quiz_response
+        except Exception as e:
+            logger.warning(f"Output repair failed: {str(e)}")
+            return None
+    
     async def generate_quiz(self, title: str, content: str, max_retries: int = 3) -> QuizResponse:
         """
         Generate a quiz from Wikipedia article content with error handling and retry logic.
@@ -175,45 +422,22 @@ Generate the response in the exact JSON format specified above. Ensure all field
             ValueError: If input validation fails
             RuntimeError: If quiz generation fails after all retries
         """
-        # Input validation
-        if not title or not title.strip():
-            raise ValueError("Article title cannot be empty")
-        
-        if not content or len(content.strip()) < 500:
-            raise ValueError("Article content too short for quiz generation (minimum 500 characters)")
-        
-        # Prepare input data
-        input_data = {
-            "title": title.strip(),
-            "content": content.strip()
-        }
-        
+        input_data = self._prepare_input(title, content)
         chain = self.get_chain()
         last_error = None
         
         for attempt in range(max_retries):
+            output_cut_short = False
             try:
                 logger.info(f"Quiz generation attempt {attempt + 1}/{max_retries} for article: {title}")
                 
-                # Generate quiz using the chain
-                result = await chain.ainvoke(input_data)
+                # Stream the generation and keep the final, fully parsed result
+                result = None
+                async for result in self.stream_quiz_data(input_data, chain, partial=False):
+                    pass
                 
-                # Validate the result structure
-                if not isinstance(result, dict):
-                    raise ValueError(f"Expected dict result, got {type(result)}")
-                
-                # Create QuizResponse object with validation
-                # Remove url from result if it exists to avoid duplicate parameter
-                result_copy = result.copy()
-                result_copy.pop('url', None)  # Remove url if present
-                
-                quiz_response = QuizResponse(
-                    url="",  # Will be set by the calling function
-                    **result_copy
-                )
-                
-                # Additional validation
-                self._validate_quiz_response(quiz_response)
+                # Validate the result structure and content
+                quiz_response = self._build_quiz_response(result)
                 
                 logger.info(f"Quiz generated successfully for article: {title}")
                 return quiz_response
@@ -222,84 +446,93 @@ Generate the response in the exact JSON format specified above. Ensure all field
                 last_error = f"JSON parsing failed: {str(e)}"
                 logger.warning(f"Attempt {attempt + 1} failed - {last_error}")
                 
+                # A cheap repair pass usually fixes malformed JSON; regenerate only if it fails
+                quiz_response = await self._repair_output(e)
+                if quiz_response is not None:
+                    logger.info(f"Quiz generated successfully for article: {title}")
+                    return quiz_response
+                output_cut_short = True
+                
             except ValidationError as e:
                 last_error = f"Data validation failed: {str(e)}"
                 logger.warning(f"Attempt {attempt + 1} failed - {last_error}")
+                # Truncated JSON parses leniently, so it shows up as missing fields
+                output_cut_short = any(
+                    error["type"] == "missing"
+                    or (error["loc"][:1] == ("quiz",) and error["type"] == "too_short")
+                    for error in e.errors()
+                )
                 
             except Exception as e:
                 last_error = f"Unexpected error: {str(e)}"
                 logger.warning(f"Attempt {attempt + 1} failed - {last_error}")
             
-            # Wait before retry (exponential backoff)
+            # Output that was truncated or came up short gets one retry with a larger budget
+            if output_cut_short and chain is self.chain:
+                logger.info(f"Escalating max_output_tokens to {ESCALATED_MAX_OUTPUT_TOKENS} for the next attempt")
+                chain = self.get_escalated_chain()
+            
+            # Wait before retry (exponential backoff with jitter, without blocking the event loop)
             if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # 1s, 2s, 4s
-                logger.info(f"Waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
+                wait_time = (2 ** attempt) * (0.5 + random.random() * 0.5)
+                logger.info(f"Waiting {wait_time:.2f}s before retry...")
+                await asyncio.sleep(wait_time)
         
         # All retries failed
         error_msg = f"Quiz generation failed after {max_retries} attempts. Last error: {last_error}"
         logger.error(error_msg)
         raise RuntimeError(error_msg)
-    
-    def _validate_quiz_response(self, quiz_response: QuizResponse) -> None:
-        """
-        Args:
-            quiz_response (QuizResponse): The quiz response to validate
-            
-        Raises:
-            ValueError: If validation fails
-        """
-        # Validate quiz questions
-        if not quiz_response.quiz or len(quiz_response.quiz) < 5:
-            raise ValueError("Quiz must contain at least 5 questions")
-        
-        if len(quiz_response.quiz) > 10:
-            raise ValueError("Quiz must contain at most 10 questions")
-        
-        # Validate each question
-        for i, question in enumerate(quiz_response.quiz):
-            if len(question.options) != 4:
-                raise ValueError(f"Question {i+1} must have exactly 4 options")
-            
-            if question.answer not in ['A', 'B', 'C', 'D']:
-                raise ValueError(f"Question {i+1} answer must be A, B, C, or D")
-            
-            if question.difficulty not in ['easy', 'medium', 'hard']:
-                raise ValueError(f"Question {i+1} difficulty must be easy, medium, or hard")
-        
-        # Validate other fields
-        if not quiz_response.title or len(quiz_response.title.strip()) == 0:
-            raise ValueError("Quiz title cannot be empty")
-        
-        if not quiz_response.summary or len(quiz_response.summary.strip()) < 50:
-            raise ValueError("Quiz summary must be at least 50 characters")
-        
-        if not quiz_response.sections:
-            raise ValueError("Quiz must have at least one section")
-        
-        if len(quiz_response.related_topics) < 3:
-            raise ValueError("Quiz must have at least 3 related topics")
-        
-        logger.info("Quiz response validation passed")
 
 
-# Global instance for use across the application
+# Global instance for use across the application. The Gemini client inside it
+# holds the HTTP/gRPC connections, so it must be created exactly once.
 llm_quiz_generator = None
+_llm_quiz_generator_lock = threading.Lock()
+
+# In-process memo of generated quizzes keyed by (title, content hash), so
+# re-scrapes of an unchanged article skip the LLM entirely
+QUIZ_MEMO_MAX_SIZE = 256
+_quiz_memo: OrderedDict[Tuple[str, str], QuizResponse] = OrderedDict()
+
+# Generations in progress by the same key, so concurrent requests for identical
+# content (e.g. an article and its redirects) share one Gemini call
+_quiz_in_flight: Dict[Tuple[str, str], "asyncio.Future[QuizResponse]"] = {}
+
+
+def compute_content_hash(content: str) -> str:
+    """Return a short, stable fingerprint of article content."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def get_llm_quiz_generator() -> LLMQuizGenerator:
     global llm_quiz_generator
     if llm_quiz_generator is None:
-        llm_quiz_generator = LLMQuizGenerator()
+        with _llm_quiz_generator_lock:
+            if llm_quiz_generator is None:
+                llm_quiz_generator = LLMQuizGenerator()
     return llm_quiz_generator
 
 
-async def generate_quiz_from_content(title: str, content: str, url: str = "") -> QuizResponse:
+def _remember_quiz(memo_key: Tuple[str, str], quiz_response: QuizResponse) -> QuizResponse:
+    """Memoize a copy of a generated quiz and return the memo entry."""
+    _quiz_memo[memo_key] = quiz_response.model_copy()
+    if len(_quiz_memo) > QUIZ_MEMO_MAX_SIZE:
+        _quiz_memo.popitem(last=False)
+    return _quiz_memo[memo_key]
+
+
+async def generate_quiz_from_content(
+    title: str,
+    content: str,
+    url: str = "",
+    content_hash: Optional[str] = None
+) -> QuizResponse:
     """
     Args:
         title (str): The Wikipedia article title
         content (str): The cleaned article content
         url (str): The original Wikipedia URL (optional)
+        content_hash (str): Precomputed compute_content_hash(content) (optional)
         
     Returns:
         QuizResponse: The generated quiz data
@@ -309,8 +542,35 @@ async def generate_quiz_from_content(title: str, content: str, url: str = "") ->
         RuntimeError: If quiz generation fails
     """
     try:
-        generator = get_llm_quiz_generator()
-        quiz_response = await generator.generate_quiz(title, content)
+        memo_key = (title, content_hash or compute_content_hash(content))
+        memoized = _quiz_memo.get(memo_key)
+        
+        if memoized is not None:
+            _quiz_memo.move_to_end(memo_key)
+            logger.info(f"Reusing memoized quiz for article: {title}")
+            # Validated when first generated; a shallow copy lets callers set
+            # id and url without re-validating or touching the memo entry
+            quiz_response = memoized.model_copy()
+        elif memo_key in _quiz_in_flight:
+            logger.info(f"Joining in-flight quiz generation for article: {title}")
+            quiz_response = (await asyncio.shield(_quiz_in_flight[memo_key])).model_copy()
+        else:
+            future = asyncio.get_running_loop().create_future()
+            _quiz_in_flight[memo_key] = future
+            try:
+                generator = get_llm_quiz_generator()
+                quiz_response = await generator.generate_quiz(title, content)
+                future.set_result(_remember_quiz(memo_key, quiz_response))
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Mark the exception retrieved so an unjoined future doesn't log it again
+                future.exception()
+                raise
+            finally:
+                del _quiz_in_flight[memo_key]
         
         # Set the URL if provided
         if url:
@@ -323,6 +583,60 @@ async def generate_quiz_from_content(title: str, content: str, url: str = "") ->
         raise
 
 
+async def stream_quiz_from_content(
+    title: str,
+    content: str,
+    url: str = "",
+    content_hash: Optional[str] = None
+) -> AsyncIterator[Union[QuizQuestion, QuizResponse]]:
+    """
+    Stream quiz questions as the model completes them, then the whole quiz.
+    
+    A question is yielded once the model has moved on to the next one; the
+    last item is always the validated QuizResponse. Memoized or in-flight
+    articles yield only that final item. If the streamed output fails
+    validation, the quiz is regenerated through generate_quiz_from_content,
+    so the final quiz may differ from the questions already yielded.
+    
+    Raises:
+        ValueError: If input validation fails
+        RuntimeError: If quiz generation fails
+    """
+    memo_key = (title, content_hash or compute_content_hash(content))
+    if memo_key in _quiz_memo or memo_key in _quiz_in_flight:
+        yield await generate_quiz_from_content(title, content, url, memo_key[1])
+        return
+    
+    generator = get_llm_quiz_generator()
+    result = None
+    emitted = 0
+    try:
+        async for result in generator.stream_quiz(title, content):
+            questions = result.get("quiz") if isinstance(result, dict) else None
+            if not isinstance(questions, list):
+                continue
+            # The last question may still be incomplete until the stream ends
+            for question in questions[emitted:-1]:
+                emitted += 1
+                try:
+                    yield QuizQuestion.model_validate(question)
+                except ValidationError:
+                    continue
+        
+        quiz_response = generator._build_quiz_response(result)
+        for question in quiz_response.quiz[emitted:]:
+            yield question
+    except (OutputParserException, ValidationError) as e:
+        logger.warning(f"Streamed quiz for '{title}' was invalid, regenerating: {str(e)}")
+        yield await generate_quiz_from_content(title, content, url, memo_key[1])
+        return
+    
+    quiz_response = _remember_quiz(memo_key, quiz_response).model_copy()
+    if url:
+        quiz_response.url = url
+    yield quiz_response
+
+
 def validate_llm_setup() -> Dict[str, Any]:
     """
     Validate the complete LLM setup.
@@ -353,7 +667,6 @@ if __name__ == "__main__":
     # Test with sample content if API key is available
     if results.get("api_key_configured"):
         print("\nTesting quiz generation with sample content...")
-        import asyncio
         
         sample_title = "Artificial Intelligence"
         sample_content = """
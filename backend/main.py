@@ -6,26 +6,37 @@ error handling, logging, and all API endpoints for quiz generation
 and history management.
 """
 
+import os
+import asyncio
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict
-from collections import OrderedDict
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 
-from fastapi import FastAPI, HTTPException, Depends, status
+import orjson
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, status
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from anyio import to_thread
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_database_session, init_database, Quiz
+from database import (
+    async_engine, get_db, async_session_scope, init_database, reserve_quiz_id, insert_quiz,
+    fetch_quiz_json, find_quiz_json_by_url, find_quiz_json_by_content_hash, list_quiz_summaries
+)
 from models import (
-    QuizRequest, QuizResponse, QuizSummary, ErrorResponse, 
+    QuizRequest, QuizResponse, QuizQuestion, QuizSummary, ErrorResponse, 
     HealthResponse, ScrapedContent
 )
-from scraper import scrape_wikipedia_sync, is_valid_wikipedia_url
-from llm_quiz_generator import generate_quiz_from_content
-import json
+from scraper import create_http_client, scrape_wikipedia_async
+from llm_quiz_generator import (
+    generate_quiz_from_content, stream_quiz_from_content, compute_content_hash
+)
 
 # Configure logging
 logging.basicConfig(
@@ -34,29 +45,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Simple in-memory cache for quiz data (URL -> quiz_id mapping)
-# Using OrderedDict for LRU-like behavior
+class QuizCache:
+    """
+    In-memory LRU cache of serialized quiz responses keyed by URL.
+    
+    A plain dict keeps insertion order, so re-inserting a key marks it most
+    recently used and the first key is always the LRU entry. Bounded by both
+    entry count and total bytes.
+    """
+    
+    def __init__(self, max_size: int, max_bytes: int):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._entries: Dict[str, bytes] = {}
+        self._bytes = 0
+    
+    def get(self, url: str) -> Optional[bytes]:
+        """Get serialized quiz JSON if cached, marking it most recently used."""
+        quiz_json = self._entries.pop(url, None)
+        if quiz_json is not None:
+            self._entries[url] = quiz_json
+        return quiz_json
+    
+    def put(self, url: str, quiz_json: bytes):
+        """Add or replace an entry, evicting the oldest while over either limit."""
+        self.remove(url)
+        self._entries[url] = quiz_json
+        self._bytes += len(quiz_json)
+        while len(self._entries) > self.max_size or self._bytes > self.max_bytes:
+            self._bytes -= len(self._entries.pop(next(iter(self._entries))))
+    
+    def remove(self, url: str):
+        """Drop an entry if present."""
+        quiz_json = self._entries.pop(url, None)
+        if quiz_json is not None:
+            self._bytes -= len(quiz_json)
+
+
 QUIZ_CACHE_MAX_SIZE = 100
-quiz_cache: OrderedDict[str, int] = OrderedDict()
+QUIZ_CACHE_MAX_BYTES = 8 * 1024 * 1024
+quiz_cache = QuizCache(QUIZ_CACHE_MAX_SIZE, QUIZ_CACHE_MAX_BYTES)
 
-def add_to_cache(url: str, quiz_id: int):
-    """Add a quiz to the cache with LRU eviction."""
-    if url in quiz_cache:
-        # Move to end (most recently used)
-        quiz_cache.move_to_end(url)
-    else:
-        quiz_cache[url] = quiz_id
-        # Evict oldest if cache is full
-        if len(quiz_cache) > QUIZ_CACHE_MAX_SIZE:
-            quiz_cache.popitem(last=False)
-
-def get_from_cache(url: str) -> Optional[int]:
-    """Get quiz ID from cache if it exists."""
-    if url in quiz_cache:
-        # Move to end (most recently used)
-        quiz_cache.move_to_end(url)
-        return quiz_cache[url]
-    return None
+# Worker threads for blocking work (HTML parsing, sync endpoints); both Starlette's
+# anyio limiter and asyncio's default executor are capped at this size
+THREADPOOL_MAX_WORKERS = int(os.getenv("THREADPOOL_MAX_WORKERS", "16"))
+
+# Pending generations by URL, so concurrent requests for one article share a single
+# scrape and LLM call
+in_flight: Dict[str, asyncio.Future] = {}
 
 # Create FastAPI application
 app = FastAPI(
@@ -83,6 +119,26 @@ app.add_middleware(
 )
 
 
+# Request validation handler: quiz generation keeps its 400 contract for URLs
+# rejected by the Wikipedia URL validator; missing fields and type errors stay 422
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc: RequestValidationError):
+    url_rejected = request.url.path.startswith("/generate_quiz") and any(
+        error["type"] == "value_error" and error["loc"][-1:] == ("url",)
+        for error in exc.errors()
+    )
+    if not url_rejected:
+        return await request_validation_exception_handler(request, exc)
+    
+    message = "Invalid Wikipedia URL format. Please provide a valid English Wikipedia article URL."
+    logger.warning(f"Request validation failed for {request.url.path}: {message}")
+    
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": message}
+    )
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -120,11 +176,21 @@ async def startup_event():
     try:
         logger.info("Starting AI Wiki Quiz Generator API...")
         
+        # Bound worker threads so request bursts queue instead of fanning out
+        to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_MAX_WORKERS
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=THREADPOOL_MAX_WORKERS)
+        )
+        
         # Initialize database
         init_database()
         logger.info("Database initialized successfully")
         
-        # Validate LLM setup
+        # Shared keep-alive HTTP client for Wikipedia requests
+        app.state.http = create_http_client()
+        
+        # Create the LLM client eagerly so its connections are reused from the
+        # first request onwards, then validate the setup
         from llm_quiz_generator import validate_llm_setup
         llm_validation = validate_llm_setup()
         
@@ -144,14 +210,18 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down AI Wiki Quiz Generator API...")
+    
+    http_client = getattr(app.state, "http", None)
+    if http_client is not None:
+        await http_client.aclose()
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check(db: Session = Depends(get_database_session)):
+async def health_check():
     try:
-        # Test database connection
-        from sqlalchemy import text
-        db.execute(text("SELECT 1"))
+        # Test database connection (outside get_db, so a failed connect reports unhealthy)
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         database_connected = True
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}")
@@ -174,11 +244,291 @@ async def root():
     }
 
 
+async def persist_quiz(
+    quiz_id: int,
+    url: str,
+    title: str,
+    quiz_data: dict,
+    content: str,
+    content_hash: str
+):
+    """
+    Write a generated quiz under its reserved ID, after the response is sent.
+    
+    On failure the URL is evicted from the cache so the next request regenerates
+    instead of serving an ID that was never stored.
+    """
+    try:
+        async with async_session_scope() as db:
+            # Original content is kept for reference
+            await insert_quiz(
+                db,
+                url=url,
+                title=title,
+                full_quiz_data=quiz_data,
+                scraped_content=content,
+                content_hash=content_hash,
+                quiz_id=quiz_id
+            )
+            await db.commit()
+        logger.info(f"Quiz stored in database with ID: {quiz_id}")
+    except Exception as e:
+        logger.error(f"Failed to store quiz {quiz_id}: {str(e)}")
+        quiz_cache.remove(url)
+
+
+async def _find_quiz_by_url(url: str) -> Optional[bytes]:
+    """Return and cache the newest stored quiz for a URL, if any."""
+    try:
+        # Short-lived session, so no connection is held while a miss goes on to scrape
+        async with async_session_scope() as db:
+            stored_quiz = await find_quiz_json_by_url(db, url)
+        if stored_quiz:
+            stored_id, quiz_json = stored_quiz
+            quiz_body = quiz_json.encode()
+            quiz_cache.put(url, quiz_body)
+            logger.info(f"Returning stored quiz {stored_id} for URL: {url}")
+            return quiz_body
+    except SQLAlchemyError as e:
+        # Fall through to generation if the lookup fails
+        logger.error(f"Error looking up quiz by URL: {str(e)}")
+    return None
+
+
+async def _find_quiz_by_content(url: str, content_hash: str) -> Optional[bytes]:
+    """Return and cache a stored quiz generated from identical content, if any."""
+    try:
+        # Short-lived session, so no connection is held while a miss goes on to the LLM
+        async with async_session_scope() as db:
+            existing_quiz = await find_quiz_json_by_content_hash(db, content_hash)
+        if existing_quiz:
+            existing_id, quiz_json = existing_quiz
+            quiz_body = quiz_json.encode()
+            quiz_cache.put(url, quiz_body)
+            logger.info(f"Content unchanged, returning stored quiz {existing_id}")
+            return quiz_body
+    except SQLAlchemyError as e:
+        # Fall through to generation if the lookup fails
+        logger.error(f"Error looking up quiz by content hash: {str(e)}")
+    return None
+
+
+async def _scrape_article(url: str) -> Tuple[str, str]:
+    """
+    Scrape a Wikipedia article.
+    
+    Returns:
+        Tuple[str, str]: (title, content)
+        
+    Raises:
+        HTTPException: If the article cannot be fetched or extracted
+    """
+    try:
+        title, content = await scrape_wikipedia_async(app.state.http, url)
+        
+        if not title or not content:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Failed to extract content from Wikipedia article. The article may not exist or be inaccessible."
+            )
+        
+        logger.info(f"Successfully scraped article: {title} ({len(content)} characters)")
+        return title, content
+        
+    except ValueError as e:
+        # URL validation or content extraction errors
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Article processing failed: {str(e)}"
+        )
+    except Exception as e:
+        # Network or other scraping errors
+        logger.error(f"Scraping error for {url}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to access Wikipedia. Please check the URL and try again later."
+        )
+
+
+def _generation_error(e: Exception) -> HTTPException:
+    """Map a quiz generation failure to the HTTP error returned to clients."""
+    if isinstance(e, ValueError):
+        # Input validation errors
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Quiz generation failed: {str(e)}"
+        )
+    if isinstance(e, RuntimeError):
+        # LLM generation errors
+        logger.error(f"LLM generation error: {str(e)}")
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Quiz generation service temporarily unavailable. Please try again later."
+        )
+    # Unexpected LLM errors
+    logger.error(f"Unexpected LLM error: {str(e)}")
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="An error occurred during quiz generation. Please try again."
+    )
+
+
+async def _store_quiz(
+    url: str,
+    title: str,
+    content: str,
+    content_hash: str,
+    quiz_response: QuizResponse,
+    background_tasks: BackgroundTasks
+) -> bytes:
+    """
+    Assign a generated quiz its ID, cache it and schedule the database write.
+    
+    Returns:
+        bytes: Serialized QuizResponse JSON
+        
+    Raises:
+        HTTPException: If an ID cannot be reserved
+    """
+    # Reserve the quiz ID; the row itself is written after the response is sent
+    try:
+        async with async_session_scope() as db:
+            quiz_id = await reserve_quiz_id(db)
+    except SQLAlchemyError as e:
+        logger.error(f"Database error reserving quiz ID: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save quiz data. Please try again."
+        )
+    
+    # Quiz data is stored as JSONB, so pass a JSON-compatible dict
+    quiz_data = quiz_response.model_dump(mode="json")
+    
+    # Update response with database ID and serialize it once for reply and cache
+    quiz_response.id = quiz_id
+    quiz_body = quiz_response.model_dump_json().encode()
+    
+    # Add to cache so repeat requests are served while the write is pending
+    quiz_cache.put(url, quiz_body)
+    background_tasks.add_task(
+        persist_quiz, quiz_id, url, title, quiz_data, content, content_hash
+    )
+    
+    logger.info(f"Quiz generation completed successfully for: {title}")
+    return quiz_body
+
+
+async def _scrape_generate_and_store(
+    url: str,
+    background_tasks: BackgroundTasks
+) -> bytes:
+    """
+    Scrape an article, generate its quiz and schedule it for storage.
+    
+    Args:
+        url (str): Validated Wikipedia article URL
+        background_tasks (BackgroundTasks): Tasks run after the response is sent
+        
+    Returns:
+        bytes: Serialized QuizResponse JSON
+        
+    Raises:
+        HTTPException: For various error conditions
+    """
+    # Step 2: Scrape Wikipedia content
+    title, content = await _scrape_article(url)
+    
+    # Step 2.5: Reuse a stored quiz generated from identical content
+    content_hash = compute_content_hash(content)
+    quiz_body = await _find_quiz_by_content(url, content_hash)
+    if quiz_body is not None:
+        return quiz_body
+    
+    # Step 3: Generate quiz using LLM
+    try:
+        quiz_response = await generate_quiz_from_content(
+            title, content, url, content_hash=content_hash
+        )
+        logger.info(f"Quiz generated successfully with {len(quiz_response.quiz)} questions")
+    except Exception as e:
+        raise _generation_error(e)
+    
+    # Step 4: Cache and store the quiz
+    return await _store_quiz(url, title, content, content_hash, quiz_response, background_tasks)
+
+
+def _quiz_event(quiz_body: bytes) -> bytes:
+    """NDJSON line carrying a complete serialized quiz."""
+    return b'{"event":"quiz","data":' + quiz_body + b'}\n'
+
+
+async def _join_in_flight(url: str, pending: asyncio.Future) -> bytes:
+    """Wait for a generation of the same URL that another request started."""
+    logger.info(f"Waiting on in-flight generation for URL: {url}")
+    try:
+        return await asyncio.shield(pending)
+    except asyncio.CancelledError:
+        if not pending.cancelled():
+            # This request itself was cancelled
+            raise
+        # The leading request went away (e.g. a stream client disconnected)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Quiz generation for this article was interrupted. Please try again."
+        )
+
+
+def _release_in_flight(url: str, future: asyncio.Future):
+    """Drop a generation's in_flight entry, cancelling it if it never settled."""
+    if not future.done():
+        future.cancel()
+    if in_flight.get(url) is future:
+        del in_flight[url]
+
+
+async def _stream_quiz_events(
+    url: str,
+    title: str,
+    content: str,
+    content_hash: str,
+    background_tasks: BackgroundTasks,
+    future: asyncio.Future
+) -> AsyncIterator[bytes]:
+    """
+    Yield NDJSON events for each generated question, then the stored quiz.
+    
+    The outcome is also set on future, the in_flight entry that other requests
+    for the same URL are waiting on.
+    """
+    try:
+        index = 0
+        async for item in stream_quiz_from_content(title, content, url, content_hash=content_hash):
+            if isinstance(item, QuizQuestion):
+                yield orjson.dumps({"event": "question", "index": index, "data": item.model_dump()}) + b"\n"
+                index += 1
+                continue
+            
+            logger.info(f"Quiz generated successfully with {len(item.quiz)} questions")
+            quiz_body = await _store_quiz(url, title, content, content_hash, item, background_tasks)
+            future.set_result(quiz_body)
+            yield _quiz_event(quiz_body)
+    except Exception as e:
+        error = e if isinstance(e, HTTPException) else _generation_error(e)
+        if not future.done():
+            future.set_exception(error)
+            # Mark the exception retrieved so an unjoined future doesn't log it again
+            future.exception()
+        yield orjson.dumps({"event": "error", "status": error.status_code, "message": error.detail}) + b"\n"
+    finally:
+        # Also runs when the client disconnects mid-stream
+        _release_in_flight(url, future)
+
+
 # Quiz generation endpoint
 @app.post("/generate_quiz", response_model=QuizResponse)
 async def generate_quiz(
     request: QuizRequest,
-    db: Session = Depends(get_database_session)
+    background_tasks: BackgroundTasks
 ):
     """
     Generate a comprehensive quiz from a Wikipedia article URL.
@@ -187,12 +537,12 @@ async def generate_quiz(
     1. Validates the Wikipedia URL
     2. Scrapes the article content
     3. Generates quiz using LLM
-    4. Stores complete quiz data in database
-    5. Returns structured quiz response
+    4. Returns structured quiz response
+    5. Stores complete quiz data in database once the response is sent
     
     Args:
         request (QuizRequest): Request containing Wikipedia URL
-        db (Session): Database session
+        background_tasks (BackgroundTasks): Runs the database write after responding
         
     Returns:
         QuizResponse: Complete quiz data with metadata
@@ -203,129 +553,43 @@ async def generate_quiz(
     try:
         logger.info(f"Quiz generation requested for URL: {request.url}")
         
-        # Step 1: Validate URL format
-        if not is_valid_wikipedia_url(request.url):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid Wikipedia URL format. Please provide a valid English Wikipedia article URL."
-            )
+        # Step 1: URL format was already validated by QuizRequest
         
-        # Step 1.5: Check cache for existing quiz
-        cached_quiz_id = get_from_cache(request.url)
-        if cached_quiz_id:
-            logger.info(f"Cache hit for URL: {request.url} (quiz_id: {cached_quiz_id})")
-            try:
-                # Retrieve cached quiz from database
-                cached_quiz = db.query(Quiz).filter(Quiz.id == cached_quiz_id).first()
-                if cached_quiz:
-                    quiz_data = json.loads(cached_quiz.full_quiz_data)
-                    quiz_response = QuizResponse(**quiz_data)
-                    quiz_response.id = cached_quiz.id
-                    logger.info(f"Returning cached quiz {cached_quiz_id}")
-                    return quiz_response
-                else:
-                    # Cache entry is stale, remove it
-                    logger.warning(f"Cached quiz {cached_quiz_id} not found in database, regenerating")
-                    quiz_cache.pop(request.url, None)
-            except Exception as e:
-                logger.error(f"Error retrieving cached quiz: {str(e)}")
-                # Continue to regenerate if cache retrieval fails
-                quiz_cache.pop(request.url, None)
-        
-        # Step 2: Scrape Wikipedia content
-        try:
-            title, content = scrape_wikipedia_sync(request.url)
-            
-            if not title or not content:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Failed to extract content from Wikipedia article. The article may not exist or be inaccessible."
-                )
-            
-            logger.info(f"Successfully scraped article: {title} ({len(content)} characters)")
-            
-        except ValueError as e:
-            # URL validation or content extraction errors
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Article processing failed: {str(e)}"
-            )
-        except Exception as e:
-            # Network or other scraping errors
-            logger.error(f"Scraping error for {request.url}: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Failed to access Wikipedia. Please check the URL and try again later."
-            )
+        # Step 1.5: Serve a cached quiz straight from memory
+        cached_quiz = quiz_cache.get(request.url)
+        if cached_quiz is not None:
+            logger.info(f"Cache hit for URL: {request.url}")
+            return Response(content=cached_quiz, media_type="application/json")
         
-        # Step 3: Generate quiz using LLM
-        try:
-            quiz_response = await generate_quiz_from_content(title, content, request.url)
-            logger.info(f"Quiz generated successfully with {len(quiz_response.quiz)} questions")
-            
-        except ValueError as e:
-            # Input validation errors
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Quiz generation failed: {str(e)}"
-            )
-        except RuntimeError as e:
-            # LLM generation errors
-            logger.error(f"LLM generation error: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Quiz generation service temporarily unavailable. Please try again later."
-            )
-        except Exception as e:
-            # Unexpected LLM errors
-            logger.error(f"Unexpected LLM error: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An error occurred during quiz generation. Please try again."
-            )
+        # Step 1.6: Reuse the newest stored quiz for this URL
+        quiz_body = await _find_quiz_by_url(request.url)
+        if quiz_body is not None:
+            return Response(content=quiz_body, media_type="application/json")
         
-        # Step 4: Store quiz in database
+        # Step 1.7: Join an identical request that is already being generated
+        pending = in_flight.get(request.url)
+        if pending is not None:
+            quiz_body = await _join_in_flight(request.url, pending)
+            return Response(content=quiz_body, media_type="application/json")
+        
+        # Steps 2-4: Scrape, generate and store, sharing the outcome with any joiners
+        future = asyncio.get_running_loop().create_future()
+        in_flight[request.url] = future
         try:
-            # Serialize quiz data to JSON
-            quiz_data_json = quiz_response.json()
-            
-            # Create database record
-            db_quiz = Quiz(
-                url=request.url,
-                title=title,
-                date_generated=datetime.utcnow(),
-                scraped_content=content,  # Store original content for reference
-                full_quiz_data=quiz_data_json
-            )
-            
-            db.add(db_quiz)
-            db.commit()
-            db.refresh(db_quiz)
-            
-            # Update response with database ID
-            quiz_response.id = db_quiz.id
-            
-            # Add to cache
-            add_to_cache(request.url, db_quiz.id)
-            logger.info(f"Quiz stored in database with ID: {db_quiz.id} and added to cache")
-            
-        except SQLAlchemyError as e:
-            db.rollback()
-            logger.error(f"Database error storing quiz: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save quiz data. Please try again."
-            )
+            quiz_body = await _scrape_generate_and_store(request.url, background_tasks)
+            future.set_result(quiz_body)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
         except Exception as e:
-            db.rollback()
-            logger.error(f"Unexpected database error: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An error occurred while saving the quiz. Please try again."
-            )
+            future.set_exception(e)
+            # Mark the exception retrieved so an unjoined future doesn't log it again
+            future.exception()
+            raise
+        finally:
+            in_flight.pop(request.url, None)
         
-        logger.info(f"Quiz generation completed successfully for: {title}")
-        return quiz_response
+        return Response(content=quiz_body, media_type="application/json")
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -340,20 +604,94 @@ async def generate_quiz(
         )
 
 
+# Streaming quiz generation endpoint
+@app.post("/generate_quiz/stream")
+async def generate_quiz_stream(
+    request: QuizRequest,
+    background_tasks: BackgroundTasks
+):
+    """
+    Generate a quiz like /generate_quiz, streaming questions as they are produced.
+    
+    The response is newline-delimited JSON. Each line is an event object:
+    {"event": "question", "index": n, "data": {...}} for every question as
+    soon as the model completes it, then {"event": "quiz", "data": {...}}
+    with the full stored quiz. Cached and stored quizzes produce only the
+    final "quiz" event. Failures after streaming has started are reported as
+    {"event": "error", "status": ..., "message": ...}.
+    
+    Args:
+        request (QuizRequest): Request containing Wikipedia URL
+        background_tasks (BackgroundTasks): Runs the database write after responding
+        
+    Returns:
+        StreamingResponse: NDJSON event stream
+        
+    Raises:
+        HTTPException: If the article cannot be scraped
+    """
+    logger.info(f"Streaming quiz generation requested for URL: {request.url}")
+    
+    quiz_body = quiz_cache.get(request.url)
+    if quiz_body is None:
+        quiz_body = await _find_quiz_by_url(request.url)
+    if quiz_body is not None:
+        return StreamingResponse(iter([_quiz_event(quiz_body)]), media_type="application/x-ndjson")
+    
+    # Join a generation of the same URL already running for either endpoint
+    pending = in_flight.get(request.url)
+    if pending is not None:
+        quiz_body = await _join_in_flight(request.url, pending)
+        return StreamingResponse(iter([_quiz_event(quiz_body)]), media_type="application/x-ndjson")
+    
+    # Register this generation so concurrent requests join it instead of starting their own
+    future = asyncio.get_running_loop().create_future()
+    in_flight[request.url] = future
+    try:
+        title, content = await _scrape_article(request.url)
+        content_hash = compute_content_hash(content)
+        quiz_body = await _find_quiz_by_content(request.url, content_hash)
+    except BaseException as e:
+        if isinstance(e, Exception):
+            future.set_exception(e)
+            future.exception()
+        _release_in_flight(request.url, future)
+        raise
+    
+    if quiz_body is not None:
+        future.set_result(quiz_body)
+        _release_in_flight(request.url, future)
+        return StreamingResponse(iter([_quiz_event(quiz_body)]), media_type="application/x-ndjson")
+    
+    # The stream settles and releases the in_flight entry once generation finishes
+    return StreamingResponse(
+        _stream_quiz_events(request.url, title, content, content_hash, background_tasks, future),
+        media_type="application/x-ndjson"
+    )
+
+
 # Quiz history endpoint
 @app.get("/history", response_model=List[QuizSummary])
 async def get_quiz_history(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_database_session)
+    before_date: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve quiz history with pagination support.
     
+    Pages can be requested by offset (skip) or, more cheaply for deep pages,
+    by keyset: pass the date_generated and id of the last summary received
+    as before_date and before_id.
+    
     Args:
         skip (int): Number of records to skip (for pagination)
         limit (int): Maximum number of records to return (max 100)
-        db (Session): Database session
+        before_date (datetime, optional): date_generated of the last summary seen
+        before_id (int, optional): id of the last summary seen
+        db (AsyncSession): Database session
         
     Returns:
         List[QuizSummary]: List of quiz summaries
@@ -377,29 +715,22 @@ async def get_quiz_history(
                 detail="Limit parameter must be between 1 and 100"
             )
         
-        # Query database for quiz summaries
-        try:
-            quizzes = (
-                db.query(Quiz)
-                .order_by(Quiz.date_generated.desc())
-                .offset(skip)
-                .limit(limit)
-                .all()
+        if (before_date is None) != (before_id is None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="before_date and before_id must be provided together"
             )
-            
-            # Convert to response models
-            quiz_summaries = [
-                QuizSummary(
-                    id=quiz.id,
-                    url=quiz.url,
-                    title=quiz.title,
-                    date_generated=quiz.date_generated
-                )
-                for quiz in quizzes
-            ]
+        
+        # Query database for quiz summaries, loading only the summary columns
+        try:
+            # Rows already match QuizSummary, so serialize them directly
+            quiz_summaries = await list_quiz_summaries(db, limit, skip, before_date, before_id)
             
             logger.info(f"Retrieved {len(quiz_summaries)} quiz summaries")
-            return quiz_summaries
+            return Response(
+                content=orjson.dumps(quiz_summaries, option=orjson.OPT_UTC_Z),
+                media_type="application/json"
+            )
             
         except SQLAlchemyError as e:
             logger.error(f"Database error retrieving quiz history: {str(e)}")
@@ -422,14 +753,14 @@ async def get_quiz_history(
 @app.get("/quiz/{quiz_id}", response_model=QuizResponse)
 async def get_quiz_by_id(
     quiz_id: int,
-    db: Session = Depends(get_database_session)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve a specific quiz by its database ID.
     
     Args:
         quiz_id (int): The database ID of the quiz to retrieve
-        db (Session): Database session
+        db (AsyncSession): Database session
         
     Returns:
         QuizResponse: Complete quiz data
@@ -448,15 +779,8 @@ async def get_quiz_by_id(
             )
         
         try:
-            quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
-            
-            if not quiz:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Quiz with ID {quiz_id} not found"
-                )
-            
-            logger.info(f"Found quiz: {quiz.title}")
+            # Stored data was validated on write, so it is sent back verbatim
+            quiz_json = await fetch_quiz_json(db, quiz_id)
             
         except SQLAlchemyError as e:
             logger.error(f"Database error retrieving quiz {quiz_id}: {str(e)}")
@@ -465,38 +789,15 @@ async def get_quiz_by_id(
                 detail="Failed to retrieve quiz from database. Please try again."
             )
         
-        # Deserialize JSON data back to structured format
-        try:
-            quiz_data = json.loads(quiz.full_quiz_data)
-            
-            # Create QuizResponse object with validation
-            quiz_response = QuizResponse(**quiz_data)
-            
-            # Ensure the ID matches the database record
-            quiz_response.id = quiz.id
-            
-            logger.info(f"Successfully retrieved and deserialized quiz {quiz_id}")
-            return quiz_response
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON deserialization error for quiz {quiz_id}: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Quiz data is corrupted. Please contact support."
-            )
-        except ValueError as e:
-            logger.error(f"Quiz data validation error for quiz {quiz_id}: {str(e)}")
+        if not quiz_json:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Quiz data format is invalid. Please contact support."
-            )
-        except Exception as e:
-            logger.error(f"Unexpected deserialization error for quiz {quiz_id}: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to process quiz data. Please try again."
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Quiz with ID {quiz_id} not found"
             )
         
+        logger.info(f"Successfully retrieved quiz {quiz_id}")
+        return Response(content=quiz_json, media_type="application/json")
+        
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
@@ -508,39 +809,7 @@ async def get_quiz_by_id(
         )
 
 
-# Additional error handling utilities and middleware
-@app.middleware("http")
-async def error_handling_middleware(request, call_next):
-    start_time = datetime.utcnow()
-    
-    try:
-        # Log incoming request
-        logger.info(f"Request: {request.method} {request.url}")
-        
-        response = await call_next(request)
-        
-        # Log response time
-        process_time = (datetime.utcnow() - start_time).total_seconds()
-        logger.info(f"Response: {response.status_code} ({process_time:.3f}s)")
-        
-        return response
-        
-    except Exception as e:
-        # Log the error
-        process_time = (datetime.utcnow() - start_time).total_seconds()
-        logger.error(f"Request failed after {process_time:.3f}s: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        
-        # Return generic error response
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": "Internal Server Error",
-                "message": "An unexpected error occurred during request processing.",
-                "details": None
-            }
-        )
-
+# Additional error handling utilities
 
 def validate_request_size(request_data: str, max_size: int = 1_000_000) -> None:
     """
@@ -643,6 +912,7 @@ async def api_info():
         "description": "Transform Wikipedia articles into comprehensive educational quizzes using AI",
         "endpoints": {
             "POST /generate_quiz": "Generate a quiz from a Wikipedia URL",
+            "POST /generate_quiz/stream": "Generate a quiz, streaming questions as NDJSON",
             "GET /history": "Get quiz history with pagination",
             "GET /quiz/{quiz_id}": "Get a specific quiz by ID",
             "GET /health": "Health check endpoint",
@@ -663,5 +933,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # Per-request logging comes from uvicorn's access log
+        access_log=True
     )
\ No newline at end of file
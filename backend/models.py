@@ -5,11 +5,20 @@ This module defines all the data models used for API requests/responses
 and LLM output validation in the AI Wiki Quiz Generator.
 """
 
+import re
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl, validator
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, validator
 
 
+# Accepted quiz source URLs, compiled once: English Wikipedia articles only, with
+# no sub-path, fragment or query and not in a special namespace (Talk:, File:, ...)
+_WIKIPEDIA_URL_RE = re.compile(
+    r'^https?://en\.wikipedia\.org/wiki/'
+    r'(?!(?i:(?:(?:[a-z]+_)?talk|special|user|category|file|template|help|portal|wikipedia|mediawiki):))'
+    r'[^/#?]+$'
+)
+
 class QuizQuestion(BaseModel):
     """
     Model for individual quiz questions with multiple choice options.
@@ -18,9 +27,9 @@ class QuizQuestion(BaseModel):
     difficulty level, and an explanation.
     """
     question: str = Field(..., min_length=10, max_length=500, description="The quiz question text")
-    options: List[str] = Field(..., min_items=4, max_items=4, description="Exactly 4 multiple choice options")
-    answer: str = Field(..., pattern="^[A-D]$", description="Correct answer (A, B, C, or D)")
-    difficulty: str = Field(..., pattern="^(easy|medium|hard)$", description="Question difficulty level")
+    options: List[str] = Field(..., min_length=4, max_length=4, description="Exactly 4 multiple choice options")
+    answer: Literal["A", "B", "C", "D"] = Field(..., description="Correct answer (A, B, C, or D)")
+    difficulty: Literal["easy", "medium", "hard"] = Field(..., description="Question difficulty level")
     explanation: str = Field(..., min_length=10, max_length=300, description="Explanation for the correct answer")
     
     @validator('options')
@@ -47,16 +56,19 @@ class QuizResponse(BaseModel):
     Complete quiz response model containing all generated quiz data.
     
     This is the main response model returned by the quiz generation endpoint
-    and stored in the database.
+    and stored in the database. All structural rules for LLM output are
+    enforced here during validation.
     """
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     id: Optional[int] = Field(None, description="Database ID (set after storage)")
     url: str = Field(..., description="Original Wikipedia URL")
     title: str = Field(..., min_length=1, max_length=200, description="Article title")
     summary: str = Field(..., min_length=50, max_length=1000, description="Article summary (2-3 sentences)")
     key_entities: KeyEntities = Field(..., description="Categorized key entities from the article")
-    sections: List[str] = Field(..., min_items=1, description="Main sections/topics covered in the article")
-    quiz: List[QuizQuestion] = Field(..., min_items=5, max_items=10, description="Generated quiz questions")
-    related_topics: List[str] = Field(..., min_items=3, max_items=5, description="Related Wikipedia topics for further reading")
+    sections: List[str] = Field(..., min_length=1, description="Main sections/topics covered in the article")
+    quiz: List[QuizQuestion] = Field(..., min_length=5, max_length=10, description="Generated quiz questions")
+    related_topics: List[str] = Field(..., min_length=3, max_length=5, description="Related Wikipedia topics for further reading")
 
 
 class QuizSummary(BaseModel):
@@ -82,7 +94,7 @@ class QuizRequest(BaseModel):
     @validator('url')
     def validate_wikipedia_url(cls, v):
         """Validate that the URL is a Wikipedia URL."""
-        if not v.startswith(('https://en.wikipedia.org/wiki/', 'http://en.wikipedia.org/wiki/')):
+        if not _WIKIPEDIA_URL_RE.match(v):
             raise ValueError("URL must be a valid English Wikipedia article URL")
         return v
 
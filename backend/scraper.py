@@ -6,9 +6,31 @@ extracting main content while removing boilerplate, references, and tables.
 """
 
 import re
+import asyncio
+import functools
+import threading
+import httpx
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # lexbor-backed parser; pages are parsed with BeautifulSoup when it is unavailable
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+try:
+    # Multi-pattern boilerplate scanner; the fused regex is used when it is unavailable
+    import hyperscan
+except ImportError:
+    hyperscan = None
+try:
+    # Compiled text-cleaning pass (see _textclean.pyx); regexes are used when it is not built
+    from _textclean import clean as _clean_text_compiled
+except ImportError:
+    _clean_text_compiled = None
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 import logging
 
@@ -21,12 +43,190 @@ REQUEST_TIMEOUT = 30  # seconds
 MAX_CONTENT_LENGTH = 5_000_000  # 5MB limit for content (Wikipedia articles can be large)
 USER_AGENT = "AI-Wiki-Quiz-Generator/1.0 (Educational Tool)"
 
+# Shared async HTTP client pool limits (one client is reused for the app lifetime)
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Number of distinct URLs whose validation result is memoized
+URL_VALIDATION_CACHE_SIZE = 4096
+
+# Number of scraped (title, content) articles kept in memory, keyed by URL
+ARTICLE_CACHE_MAX_SIZE = 32
+
+# Default number of articles fetched at once by scrape_wikipedia_batch
+BATCH_SCRAPE_CONCURRENCY = 8
+
+# Connection pool for the synchronous requests-based path
+SYNC_POOL_SIZE = 10
+
 # Wikipedia URL patterns
 WIKIPEDIA_URL_PATTERNS = [
     r'^https?://en\.wikipedia\.org/wiki/[^/]+$',
     r'^https?://[a-z]{2}\.wikipedia\.org/wiki/[^/]+$'  # Support other language codes
 ]
 
+# Common Wikipedia boilerplate phrases removed from extracted text
+BOILERPLATE_PATTERNS = [
+    r'Coordinates:.*?(?=\n|\.|$)',
+    r'This article needs additional citations.*?(?=\n|\.|$)',
+    r'Please help improve this article.*?(?=\n|\.|$)',
+    r'This article may require cleanup.*?(?=\n|\.|$)',
+    r'The examples and perspective in this article.*?(?=\n|\.|$)',
+]
+
+# Phrases Wikipedia uses on pages for articles that do not exist
+ERROR_INDICATORS = [
+    "Wikipedia does not have an article",
+    "The page you requested does not exist",
+    "This page does not exist"
+]
+
+# Elements that are not article prose (references, navigation, tables, media, ...)
+UNWANTED_SELECTORS = [
+    # References and citations
+    'sup.reference',
+    '.reference',
+    '.references',
+    'ol.references',
+    
+    # Navigation and metadata
+    '.navbox',
+    '.navigation-box',
+    '.infobox',
+    '.metadata',
+    '.dablink',
+    '.hatnote',
+    
+    # Tables (most are not content)
+    'table.wikitable',
+    'table.infobox',
+    'table.navbox',
+    
+    # Media and captions
+    '.thumbcaption',
+    '.gallery',
+    
+    # Navigation elements
+    '.toc',
+    '#toc',
+    '.mw-editsection',
+    
+    # Footer and administrative
+    '.catlinks',
+    '.printfooter',
+    '.mw-footer',
+    
+    # Scripts and styles
+    'script',
+    'style',
+    'noscript',
+    
+    # Coordinates and geo data
+    '.geo',
+    '.coordinates',
+    
+    # Sidebar content
+    '.sidebar',
+    '.vertical-navbox',
+    
+    # Disambiguation
+    '.dmbox',
+    '.ambox'
+]
+
+# Message boxes (maintenance notices) identified by class
+MESSAGE_BOX_CLASSES = ['mbox', 'ambox', 'tmbox', 'imbox', 'ombox', 'fmbox']
+
+
+# UNWANTED_SELECTORS and MESSAGE_BOX_CLASSES split into lookup sets, so the
+# BeautifulSoup cleanup can test each element in a single walk of the tree
+_UNWANTED_TAGS = frozenset(
+    sel for sel in UNWANTED_SELECTORS if sel[0] not in '.#' and '.' not in sel
+)
+_UNWANTED_IDS = frozenset(sel[1:] for sel in UNWANTED_SELECTORS if sel.startswith('#'))
+_UNWANTED_CLASSES = frozenset(
+    [sel[1:] for sel in UNWANTED_SELECTORS if sel.startswith('.')] + MESSAGE_BOX_CLASSES
+)
+_UNWANTED_TAG_CLASSES = frozenset(
+    tuple(sel.split('.', 1)) for sel in UNWANTED_SELECTORS if sel[0] not in '.#' and '.' in sel
+)
+
+# Title elements in order of preference
+TITLE_SELECTORS = [
+    'h1.firstHeading',
+    'h1#firstHeading',
+    '.mw-page-title-main',
+    'h1'
+]
+
+# BeautifulSoup tree builder: the C-backed lxml parser when installed, else the
+# pure-Python html.parser
+BS4_PARSER = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+
+# Only the heading and the article body are ever read (disambiguation and redirect
+# markers live inside the body), so BeautifulSoup builds just those subtrees
+ARTICLE_STRAINER = SoupStrainer(id=['firstHeading', 'mw-content-text'])
+
+# Patterns are compiled once so hot paths call bound methods directly
+_WIKI_URL_RES = [re.compile(pattern) for pattern in WIKIPEDIA_URL_PATTERNS]
+# Non-article namespaces, including their talk namespaces (User_talk:, File_talk:, ...)
+_SPECIAL_PREFIX_RE = re.compile(
+    r'/wiki/(?:(?:[a-z]+_)?talk|special|user|category|file|template|help|portal|wikipedia|mediawiki):',
+    re.IGNORECASE
+)
+_TITLE_SUFFIX_RE = re.compile(r'\s*-\s*Wikipedia.*$')
+_CITATION_RE = re.compile(r'\[[^\]]*\]')
+# Case-insensitive for ASCII only: Hyperscan's caseless mode works on bytes, and every
+# boilerplate removal path must agree (e.g. "THİS" or "Coordinateſ" are not matched)
+_BOILERPLATE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in BOILERPLATE_PATTERNS), re.IGNORECASE | re.ASCII
+)
+
+# The compiled pass only understands "<literal prefix> up to the next newline or period";
+# it is disabled if any boilerplate pattern takes another shape
+_BOILERPLATE_SUFFIX = r'.*?(?=\n|\.|$)'
+_BOILERPLATE_PREFIXES = tuple(
+    pattern[:-len(_BOILERPLATE_SUFFIX)].lower() for pattern in BOILERPLATE_PATTERNS
+)
+_BOILERPLATE_IS_LITERAL = all(
+    pattern.endswith(_BOILERPLATE_SUFFIX) and not re.search(r'[.^$*+?{}\[\]\\|()]', prefix)
+    for pattern, prefix in zip(BOILERPLATE_PATTERNS, _BOILERPLATE_PREFIXES)
+)
+if not _BOILERPLATE_IS_LITERAL:
+    _clean_text_compiled = None
+
+
+def _compile_boilerplate_db() -> Optional["hyperscan.Database"]:
+    # One Hyperscan database matching every boilerplate prefix; the "up to the next
+    # newline or period" tail is resolved on the match, as Hyperscan has no lookahead
+    if hyperscan is None or not _BOILERPLATE_IS_LITERAL:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[prefix.encode() for prefix in _BOILERPLATE_PREFIXES],
+            ids=list(range(len(_BOILERPLATE_PREFIXES))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_BOILERPLATE_PREFIXES)
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan unavailable, using regex boilerplate removal: {e}")
+        return None
+
+
+_BOILERPLATE_DB = _compile_boilerplate_db()
+
+# Hyperscan scratch space must not be shared by concurrent scans, and articles are
+# cleaned on worker threads, so each thread allocates its own on first use
+_boilerplate_scratch = threading.local()
+
+
+def _get_boilerplate_scratch() -> "hyperscan.Scratch":
+    scratch = getattr(_boilerplate_scratch, 'scratch', None)
+    if scratch is None:
+        scratch = _boilerplate_scratch.scratch = hyperscan.Scratch(_BOILERPLATE_DB)
+    return scratch
+
 
 def is_valid_wikipedia_url(url: str) -> bool:
     """
@@ -41,6 +241,12 @@ def is_valid_wikipedia_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
+    return _is_valid_wikipedia_url(url)
+
+
+# Pure over the URL string, so repeated checks of the same URL (caller, scraper, ...) are memoized
+@functools.lru_cache(maxsize=URL_VALIDATION_CACHE_SIZE)
+def _is_valid_wikipedia_url(url: str) -> bool:
     # Basic URL format validation
     try:
         parsed = urlparse(url)
@@ -50,17 +256,11 @@ def is_valid_wikipedia_url(url: str) -> bool:
         return False
     
     # Check URL format against patterns
-    for pattern in WIKIPEDIA_URL_PATTERNS:
-        if re.match(pattern, url):
-            # Additional checks
-            parsed = urlparse(url)
-            
+    for pattern in _WIKI_URL_RES:
+        if pattern.match(url):
             # Ensure it's not a special page
             wiki_path = parsed.path
-            if any(special in wiki_path.lower() for special in [
-                'special:', 'talk:', 'user:', 'category:', 'file:', 'template:',
-                'help:', 'portal:', 'wikipedia:', 'mediawiki:'
-            ]):
+            if _SPECIAL_PREFIX_RE.search(wiki_path):
                 return False
             
             # Ensure it's not a disambiguation or redirect page URL pattern
@@ -76,46 +276,46 @@ def is_valid_wikipedia_url(url: str) -> bool:
 
 
 # Validate if a Wikipedia URL is accessible without full scraping.
-def validate_url_accessibility(url: str) -> Tuple[bool, str]:
+# Returns (accessible, message, content_length); content_length is None when not declared
+# or when the URL is rejected.
+def validate_url_accessibility(url: str) -> Tuple[bool, str, Optional[int]]:
     if not is_valid_wikipedia_url(url):
-        return False, "Invalid Wikipedia URL format"
+        return False, "Invalid Wikipedia URL format", None
     
     try:
         # Make a HEAD request to check if URL is accessible
-        headers = {'User-Agent': USER_AGENT}
-        response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+        response = _SESSION.head(url, timeout=10, allow_redirects=True)
         
         if response.status_code == 404:
-            return False, "Wikipedia article not found"
+            return False, "Wikipedia article not found", None
         elif response.status_code >= 400:
-            return False, f"HTTP error: {response.status_code}"
+            return False, f"HTTP error: {response.status_code}", None
         
         content_type = response.headers.get('content-type', '').lower()
         if 'text/html' not in content_type:
-            return False, "Invalid content type - not an HTML page"
+            return False, "Invalid content type - not an HTML page", None
         
-        return True, "URL is accessible"
+        # Oversized pages are rejected here, so callers can skip the GET entirely
+        try:
+            content_length = _check_content_length(response.headers)
+        except ValueError as e:
+            return False, str(e), None
+        
+        return True, "URL is accessible", content_length
         
     except requests.exceptions.Timeout:
-        return False, "Request timeout - Wikipedia may be unavailable"
+        return False, "Request timeout - Wikipedia may be unavailable", None
     except requests.exceptions.ConnectionError:
-        return False, "Connection error - check internet connection"
+        return False, "Connection error - check internet connection", None
     except requests.exceptions.RequestException as e:
-        return False, f"Network error: {str(e)}"
+        return False, f"Network error: {str(e)}", None
     except Exception as e:
-        return False, f"Validation error: {str(e)}"
+        return False, f"Validation error: {str(e)}", None
 
 
 def extract_article_title(soup: BeautifulSoup) -> str:
     # Try multiple selectors for title
-    title_selectors = [
-        'h1.firstHeading',
-        'h1#firstHeading', 
-        '.mw-page-title-main',
-        'h1'
-    ]
-    
-    for selector in title_selectors:
+    for selector in TITLE_SELECTORS:
         title_element = soup.select_one(selector)
         if title_element:
             title = title_element.get_text().strip()
@@ -127,7 +327,7 @@ def extract_article_title(soup: BeautifulSoup) -> str:
     if title_tag:
         title = title_tag.get_text().strip()
         # Remove " - Wikipedia" suffix
-        title = re.sub(r'\s*-\s*Wikipedia.*$', '', title)
+        title = _TITLE_SUFFIX_RE.sub('', title)
         return title
     
     return "Unknown Article"
@@ -145,68 +345,20 @@ def clean_wikipedia_content(soup: BeautifulSoup) -> str:
     if not content_div:
         return ""
     
-    # Remove unwanted elements
-    unwanted_selectors = [
-        # References and citations
-        'sup.reference',
-        '.reference',
-        '.references',
-        'ol.references',
-        
-        # Navigation and metadata
-        '.navbox',
-        '.navigation-box',
-        '.infobox',
-        '.metadata',
-        '.dablink',
-        '.hatnote',
-        
-        # Tables (most are not content)
-        'table.wikitable',
-        'table.infobox',
-        'table.navbox',
-        
-        # Media and captions
-        '.thumbcaption',
-        '.gallery',
-        
-        # Navigation elements
-        '.toc',
-        '#toc',
-        '.mw-editsection',
-        
-        # Footer and administrative
-        '.catlinks',
-        '.printfooter',
-        '.mw-footer',
-        
-        # Scripts and styles
-        'script',
-        'style',
-        'noscript',
-        
-        # Coordinates and geo data
-        '.geo',
-        '.coordinates',
-        
-        # Sidebar content
-        '.sidebar',
-        '.vertical-navbox',
-        
-        # Disambiguation
-        '.dmbox',
-        '.ambox'
-    ]
-    
-    # Remove unwanted elements
-    for selector in unwanted_selectors:
-        for element in content_div.select(selector):
-            element.decompose()
-    
-    # Remove elements with specific classes that indicate non-content
-    for element in content_div.find_all(attrs={'class': True}):
-        classes = element.get('class', [])
-        if any(cls in ['mbox', 'ambox', 'tmbox', 'imbox', 'ombox', 'fmbox'] for cls in classes):
+    # Collect unwanted elements (including message boxes) in one walk, then remove them;
+    # decomposing while walking would break the traversal
+    unwanted = []
+    for element in content_div.find_all(True):
+        classes = element.get('class') or ()
+        if (element.name in _UNWANTED_TAGS or
+            element.get('id') in _UNWANTED_IDS or
+            not _UNWANTED_CLASSES.isdisjoint(classes) or
+            any((element.name, cls) in _UNWANTED_TAG_CLASSES for cls in classes)):
+            unwanted.append(element)
+    
+    for element in unwanted:
+        # Descendants of an already removed element are gone with it
+        if not element.decomposed:
             element.decompose()
     
     # Extract text content
@@ -218,43 +370,385 @@ def clean_wikipedia_content(soup: BeautifulSoup) -> str:
     return text
 
 
-def clean_text_content(text: str) -> str:
-    # Remove citation markers like [1], [citation needed], etc.
-    text = re.sub(r'\[[^\]]*\]', '', text)
+def extract_article_title_lexbor(tree: "LexborHTMLParser") -> str:
+    """selectolax counterpart of extract_article_title."""
+    for selector in TITLE_SELECTORS:
+        title_element = tree.css_first(selector)
+        if title_element:
+            title = title_element.text().strip()
+            if title:
+                return title
     
-    # Remove multiple whitespace and normalize
-    text = re.sub(r'\s+', ' ', text)
+    # Fallback to page title
+    title_tag = tree.css_first('title')
+    if title_tag:
+        return _TITLE_SUFFIX_RE.sub('', title_tag.text().strip())
     
-    # Remove leading/trailing whitespace
-    text = text.strip()
+    return "Unknown Article"
+
+
+# One combined selector removes every unwanted element in a single traversal
+_UNWANTED_SELECTOR_GROUP = ", ".join(
+    UNWANTED_SELECTORS + ['.' + cls for cls in MESSAGE_BOX_CLASSES]
+)
+
+
+def clean_wikipedia_content_lexbor(tree: "LexborHTMLParser") -> str:
+    """selectolax counterpart of clean_wikipedia_content."""
+    content_div = (
+        tree.css_first('div#mw-content-text')
+        or tree.css_first('div.mw-parser-output')
+        or tree.body
+    )
+    if not content_div:
+        return ""
+    
+    # Matches come in document order; removing them last-first destroys nested
+    # matches before their ancestors, so no node is freed twice
+    for element in reversed(content_div.css(_UNWANTED_SELECTOR_GROUP)):
+        element.decompose()
+    
+    return clean_text_content(content_div.text())
+
+
+def _remove_boilerplate_hyperscan(text: str) -> str:
+    # Works on UTF-8 bytes: '\n' and '.' never occur inside multi-byte sequences,
+    # so offsets from the scan can be used for splicing directly
+    data = text.encode('utf-8')
+    spans = []
+    _BOILERPLATE_DB.scan(
+        data,
+        match_event_handler=lambda _id, start, end, _flags, _context: spans.append((start, end)),
+        scratch=_get_boilerplate_scratch()
+    )
+    if not spans:
+        return text
+    
+    parts = []
+    kept_from = 0
+    for start, end in sorted(spans):
+        if start < kept_from:
+            # Starts inside a span that was already removed
+            continue
+        newline, period = data.find(b'\n', end), data.find(b'.', end)
+        stop = min((pos for pos in (newline, period) if pos != -1), default=len(data))
+        parts.append(data[kept_from:start])
+        kept_from = stop
+    parts.append(data[kept_from:])
+    
+    return b''.join(parts).decode('utf-8')
+
+
+def clean_text_content(text: str) -> str:
+    if _clean_text_compiled is not None:
+        return _clean_text_compiled(text, _BOILERPLATE_PREFIXES)
     
-    # Remove common Wikipedia boilerplate phrases
-    boilerplate_patterns = [
-        r'Coordinates:.*?(?=\n|\.|$)',
-        r'This article needs additional citations.*?(?=\n|\.|$)',
-        r'Please help improve this article.*?(?=\n|\.|$)',
-        r'This article may require cleanup.*?(?=\n|\.|$)',
-        r'The examples and perspective in this article.*?(?=\n|\.|$)',
-    ]
+    # Remove citation markers like [1], [citation needed], etc.
+    text = _CITATION_RE.sub('', text)
     
-    for pattern in boilerplate_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    # Remove common Wikipedia boilerplate phrases in a single pass; line breaks
+    # are still present here, so each phrase ends at its line at the latest
+    if _BOILERPLATE_DB is not None:
+        text = _remove_boilerplate_hyperscan(text)
+    else:
+        text = _BOILERPLATE_RE.sub('', text)
     
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Normalize whitespace once, after all removals (str.split also drops leading/trailing runs)
+    text = ' '.join(text.split())
     
     return text
 
 
-async def scrape_wikipedia(url: str) -> Tuple[Optional[str], Optional[str]]:
+async def scrape_wikipedia(url: str, client: Optional[httpx.AsyncClient] = None) -> Tuple[Optional[str], Optional[str]]:
     """
     Scrape Wikipedia article content and extract title and cleaned text.
     
     Args:
         url (str): Wikipedia URL to scrape
+        client (Optional[httpx.AsyncClient]): Shared client to reuse; a short-lived one is opened if omitted
         
     Returns:
         Tuple[Optional[str], Optional[str]]: (title, content) or (None, None) if failed
         
+    Raises:
+        ValueError: If URL is invalid or content issues
+        requests.RequestException: If network request fails
+        Exception: For other scraping errors
+    """
+    if client is not None:
+        return await scrape_wikipedia_async(client, url)
+    
+    # No blocking I/O here, so several articles can be scraped concurrently with asyncio.gather
+    async with create_http_client() as client:
+        return await scrape_wikipedia_async(client, url)
+
+
+async def scrape_wikipedia_batch(
+    urls: List[str],
+    concurrency: int = BATCH_SCRAPE_CONCURRENCY,
+    client: Optional[httpx.AsyncClient] = None
+) -> List[Union[Tuple[Optional[str], Optional[str]], Exception]]:
+    """
+    Scrape several Wikipedia articles concurrently over one pooled client.
+    
+    Args:
+        urls (List[str]): Wikipedia URLs to scrape
+        concurrency (int): Maximum number of articles fetched at the same time
+        client (Optional[httpx.AsyncClient]): Shared client to reuse; a short-lived one is opened if omitted
+        
+    Returns:
+        List[Union[Tuple[Optional[str], Optional[str]], Exception]]: (title, content) per URL,
+        in input order, or the exception that URL raised
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def scrape_one(url: str, http_client: httpx.AsyncClient) -> Tuple[Optional[str], Optional[str]]:
+        async with semaphore:
+            return await scrape_wikipedia_async(http_client, url)
+    
+    if client is not None:
+        return await asyncio.gather(*(scrape_one(url, client) for url in urls), return_exceptions=True)
+    
+    async with create_http_client() as client:
+        return await asyncio.gather(*(scrape_one(url, client) for url in urls), return_exceptions=True)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client used for Wikipedia requests.
+    
+    Connections are kept alive and multiplexed over HTTP/2, so repeated
+    scrapes skip the TCP/TLS handshake.
+    
+    Returns:
+        httpx.AsyncClient: Client to be closed with ``aclose()`` on shutdown
+    """
+    return httpx.AsyncClient(
+        headers={
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+        },
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        timeout=float(REQUEST_TIMEOUT),
+        follow_redirects=True,
+        http2=True
+    )
+
+
+def _create_sync_session() -> requests.Session:
+    """
+    Create the shared requests session used by the synchronous scraping path.
+    
+    Pooled connections are kept alive between calls, and transient
+    connection failures and 5xx responses are retried with backoff.
+    
+    Returns:
+        requests.Session: Session reused for the process lifetime
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    adapter = HTTPAdapter(
+        pool_connections=SYNC_POOL_SIZE,
+        pool_maxsize=SYNC_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_SESSION = _create_sync_session()
+
+# Shared by the async and sync scrapers; the lock covers callers in worker threads.
+# A plain dict keeps insertion order, so the first key is the least recently used.
+_article_cache: Dict[str, Tuple[str, str]] = {}
+_article_cache_lock = threading.Lock()
+
+
+def _get_cached_article(url: str) -> Optional[Tuple[str, str]]:
+    # Get a cached (title, content) pair, marking it most recently used
+    with _article_cache_lock:
+        article = _article_cache.pop(url, None)
+        if article is not None:
+            _article_cache[url] = article
+    return article
+
+
+def _cache_article(url: str, article: Tuple[str, str]):
+    with _article_cache_lock:
+        _article_cache.pop(url, None)
+        _article_cache[url] = article
+        while len(_article_cache) > ARTICLE_CACHE_MAX_SIZE:
+            del _article_cache[next(iter(_article_cache))]
+
+
+def invalidate_cache(url: Optional[str] = None):
+    """
+    Drop cached articles so the next scrape fetches them again.
+    
+    Args:
+        url (Optional[str]): Article to drop; clears the whole cache if omitted
+    """
+    with _article_cache_lock:
+        if url is None:
+            _article_cache.clear()
+        else:
+            _article_cache.pop(url, None)
+
+
+def _parse_article(html: bytes) -> Tuple[str, str]:
+    """
+    Parse a fetched Wikipedia page and extract its title and cleaned content.
+    
+    Args:
+        html (bytes): Raw response body
+        
+    Returns:
+        Tuple[str, str]: (title, content)
+        
+    Raises:
+        ValueError: If the page is missing, a disambiguation page, or has too little content
+    """
+    # Parse HTML with error handling; both parsers take the raw bytes, so the
+    # body is never decoded into a separate str just for substring checks
+    try:
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html)
+            find = tree.css_first
+        else:
+            soup = BeautifulSoup(html, BS4_PARSER, parse_only=ARTICLE_STRAINER)
+            find = soup.select_one
+    except Exception as e:
+        raise ValueError(f"Failed to parse HTML content: {str(e)}")
+    
+    # Missing pages carry Wikipedia's noarticletext box inside the content area
+    if find('div.noarticletext'):
+        raise ValueError("Wikipedia article not found")
+    
+    # Check for disambiguation pages
+    if (find('div.disambig') or 
+        find('div#disambigbox') or
+        find('div.dmbox-disambig')):
+        raise ValueError("URL points to a disambiguation page - please use a specific article URL")
+    
+    # Check for redirect pages
+    if find('div.redirectMsg'):
+        logger.info("Page was redirected, continuing with redirected content")
+    
+    # Extract title and content
+    try:
+        if LexborHTMLParser is not None:
+            title = extract_article_title_lexbor(tree)
+            content = clean_wikipedia_content_lexbor(tree)
+        else:
+            title = extract_article_title(soup)
+            content = clean_wikipedia_content(soup)
+    except Exception as e:
+        raise ValueError(f"Failed to extract article content: {str(e)}")
+    
+    # Validate extracted content
+    if not title or not title.strip():
+        raise ValueError("Failed to extract article title")
+    
+    if not content or not content.strip():
+        raise ValueError("Failed to extract article content")
+    
+    # Fallbacks for missing and disambiguation pages that lack the usual markup;
+    # their wording appears in the opening text
+    lead = content[:1000]
+    for indicator in ERROR_INDICATORS:
+        if indicator in lead:
+            raise ValueError("Wikipedia article not found")
+    
+    if 'may refer to:' in lead:
+        raise ValueError("URL points to a disambiguation page - please use a specific article URL")
+    
+    if len(content.strip()) < 500:
+        raise ValueError(f"Article content too short for quiz generation ({len(content.strip())} characters, minimum 500)")
+    
+    # Check for stub articles
+    if len(content.strip()) < 1000 and ('stub' in content.lower() or len(content.split()) < 100):
+        logger.warning(f"Article appears to be a stub: {title}")
+    
+    return title, content
+
+
+def _check_content_type(headers) -> None:
+    # Reject non-HTML responses before any of the body is downloaded
+    content_type = headers.get('content-type', '').lower()
+    if 'text/html' not in content_type:
+        raise ValueError(f"Invalid content type: {content_type} (expected HTML)")
+
+
+def _check_content_length(headers) -> Optional[int]:
+    # Reject early when the server already declares a body above the limit;
+    # returns the declared length, or None when the header is absent or invalid
+    declared = headers.get('content-length', '')
+    if not declared.isdigit():
+        return None
+    content_length = int(declared)
+    if content_length > MAX_CONTENT_LENGTH:
+        raise ValueError(f"Article content too large: {content_length} bytes (max: {MAX_CONTENT_LENGTH})")
+    return content_length
+
+
+def _read_limited(response: requests.Response) -> bytes:
+    """
+    Read a streamed requests response, reading at most MAX_CONTENT_LENGTH + 1 bytes.
+    
+    Raises:
+        ValueError: If the response is not HTML or the body exceeds MAX_CONTENT_LENGTH
+    """
+    _check_content_type(response.headers)
+    _check_content_length(response.headers)
+    body = response.raw.read(MAX_CONTENT_LENGTH + 1, decode_content=True)
+    if len(body) > MAX_CONTENT_LENGTH:
+        raise ValueError(f"Article content too large: more than {MAX_CONTENT_LENGTH} bytes")
+    return body
+
+
+async def _read_limited_async(response: httpx.Response) -> bytes:
+    """
+    Read a streamed httpx response, stopping as soon as MAX_CONTENT_LENGTH is exceeded.
+    
+    Raises:
+        ValueError: If the response is not HTML or the body exceeds MAX_CONTENT_LENGTH
+    """
+    _check_content_type(response.headers)
+    _check_content_length(response.headers)
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > MAX_CONTENT_LENGTH:
+            raise ValueError(f"Article content too large: more than {MAX_CONTENT_LENGTH} bytes")
+    return bytes(body)
+
+
+async def scrape_wikipedia_async(client: httpx.AsyncClient, url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Scrape a Wikipedia article over a shared, keep-alive HTTP client.
+    
+    Args:
+        client (httpx.AsyncClient): Client created by ``create_http_client``
+        url (str): Wikipedia URL to scrape
+        
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (title, content)
+        
     Raises:
         ValueError: If URL is invalid or content issues
         requests.RequestException: If network request fails
@@ -264,115 +758,46 @@ async def scrape_wikipedia(url: str) -> Tuple[Optional[str], Optional[str]]:
     if not is_valid_wikipedia_url(url):
         raise ValueError(f"Invalid Wikipedia URL format: {url}")
     
-    # Pre-validate URL accessibility
-    is_accessible, error_msg = validate_url_accessibility(url)
-    if not is_accessible:
-        raise ValueError(f"URL validation failed: {error_msg}")
+    cached = _get_cached_article(url)
+    if cached is not None:
+        logger.info(f"Using cached article for {url}")
+        return cached
     
     try:
         logger.info(f"Scraping Wikipedia article: {url}")
         
-        # Configure request headers
-        headers = {
-            'User-Agent': USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-        }
-        
-        # Make request with timeout and retries
+        # Make request with retries on timeouts and dropped connections; the body is
+        # streamed so oversized pages are abandoned without being fully downloaded
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = requests.get(
-                    url, 
-                    headers=headers, 
-                    timeout=REQUEST_TIMEOUT,
-                    allow_redirects=True
-                )
+                async with client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    html = await _read_limited_async(response)
                 break
-            except requests.exceptions.Timeout:
-                if attempt == max_retries - 1:
-                    raise
-                logger.warning(f"Timeout on attempt {attempt + 1}, retrying...")
-                continue
-            except requests.exceptions.ConnectionError:
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
                 if attempt == max_retries - 1:
                     raise
-                logger.warning(f"Connection error on attempt {attempt + 1}, retrying...")
-                continue
-        
-        response.raise_for_status()
-        
-        if len(response.content) > MAX_CONTENT_LENGTH:
-            raise ValueError(f"Article content too large: {len(response.content)} bytes (max: {MAX_CONTENT_LENGTH})")
-        
-        content_type = response.headers.get('content-type', '').lower()
-        if 'text/html' not in content_type:
-            raise ValueError(f"Invalid content type: {content_type} (expected HTML)")
-        
-        # Parse HTML with error handling
-        try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-        except Exception as e:
-            raise ValueError(f"Failed to parse HTML content: {str(e)}")
+                logger.warning(f"{type(e).__name__} on attempt {attempt + 1}, retrying...")
         
-        error_indicators = [
-            "Wikipedia does not have an article",
-            "The page you requested does not exist",
-            "This page does not exist"
-        ]
-        
-        for indicator in error_indicators:
-            if indicator in response.text:
-                raise ValueError("Wikipedia article not found")
-        
-        # Check for disambiguation pages
-        if (soup.find('div', {'class': 'disambig'}) or 
-            'may refer to:' in response.text or
-            soup.find('div', {'id': 'disambigbox'})):
-            raise ValueError("URL points to a disambiguation page - please use a specific article URL")
-        
-        # Check for redirect pages
-        if soup.find('div', {'class': 'redirectMsg'}):
-            logger.info("Page was redirected, continuing with redirected content")
-        
-        # Extract title and content
-        try:
-            title = extract_article_title(soup)
-            content = clean_wikipedia_content(soup)
-        except Exception as e:
-            raise ValueError(f"Failed to extract article content: {str(e)}")
-        
-        # Validate extracted content
-        if not title or not title.strip():
-            raise ValueError("Failed to extract article title")
-        
-        if not content or not content.strip():
-            raise ValueError("Failed to extract article content")
-        
-        if len(content.strip()) < 500:
-            raise ValueError(f"Article content too short for quiz generation ({len(content.strip())} characters, minimum 500)")
-        
-        # Check for stub articles
-        if len(content.strip()) < 1000 and ('stub' in content.lower() or len(content.split()) < 100):
-            logger.warning(f"Article appears to be a stub: {title}")
+        # Parsing a large article is CPU-bound, so keep it off the event loop
+        title, content = await asyncio.to_thread(_parse_article, html)
         
+        _cache_article(url, (title, content))
         logger.info(f"Successfully scraped article: {title} ({len(content)} characters)")
         
         return title, content
-        
-    except requests.exceptions.Timeout:
+    
+    # httpx errors are mapped onto requests exceptions to keep the module's error contract
+    except httpx.TimeoutException:
         logger.error(f"Request timeout for URL: {url}")
         raise requests.RequestException(f"Request timeout after {REQUEST_TIMEOUT} seconds - Wikipedia may be slow or unavailable")
     
-    except requests.exceptions.ConnectionError:
+    except httpx.NetworkError:
         logger.error(f"Connection error for URL: {url}")
         raise requests.RequestException("Failed to connect to Wikipedia - check your internet connection")
     
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error for URL {url}: {e}")
         if e.response.status_code == 404:
             raise ValueError("Wikipedia article not found (404 error)")
@@ -381,9 +806,9 @@ async def scrape_wikipedia(url: str) -> Tuple[Optional[str], Optional[str]]:
         elif e.response.status_code >= 500:
             raise requests.RequestException(f"Wikipedia server error: {e.response.status_code}")
         else:
-            raise requests.RequestException(f"HTTP error: {e.response.status_code} - {e.response.reason}")
+            raise requests.RequestException(f"HTTP error: {e.response.status_code} - {e.response.reason_phrase}")
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Request error for URL {url}: {e}")
         raise requests.RequestException(f"Network error while accessing Wikipedia: {str(e)}")
     
@@ -423,7 +848,7 @@ def scrape_wikipedia_with_validation(url: str) -> Tuple[Optional[str], Optional[
 # Synchronous wrapper for backward compatibility
 def scrape_wikipedia_sync(url: str) -> Tuple[Optional[str], Optional[str]]:
     """
-    Synchronous wrapper for scrape_wikipedia function.
+    Synchronous counterpart of scrape_wikipedia.
     
     Args:
         url (str): Wikipedia URL to scrape
@@ -431,20 +856,8 @@ def scrape_wikipedia_sync(url: str) -> Tuple[Optional[str], Optional[str]]:
     Returns:
         Tuple[Optional[str], Optional[str]]: (title, content) or (None, None) if failed
     """
-    import asyncio
-    
-    try:
-        # Try to get existing event loop
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're in an async context, we need to handle this differently (this is simple synchronous approach)
-            return _scrape_wikipedia_sync_internal(url)
-        except RuntimeError:
-            # No running loop, we can use asyncio.run
-            return asyncio.run(scrape_wikipedia(url))
-    except Exception:
-        # Fallback to synchronous implementation
-        return _scrape_wikipedia_sync_internal(url)
+    # The sync path has its own pooled session, so no event loop is spun up per call
+    return _scrape_wikipedia_sync_internal(url)
 
 # retuns tuple(title, content)
 def _scrape_wikipedia_sync_internal(url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -452,80 +865,24 @@ def _scrape_wikipedia_sync_internal(url: str) -> Tuple[Optional[str], Optional[s
     if not is_valid_wikipedia_url(url):
         raise ValueError(f"Invalid Wikipedia URL format: {url}")
     
-    # Pre-validate URL accessibility
-    is_accessible, error_msg = validate_url_accessibility(url)
-    if not is_accessible:
-        raise ValueError(f"URL validation failed: {error_msg}")
+    cached = _get_cached_article(url)
+    if cached is not None:
+        logger.info(f"Using cached article for {url}")
+        return cached
     
+    # Status and content type are checked on the GET response, no separate HEAD round-trip
     try:
         logger.info(f"Scraping Wikipedia article: {url}")
         
-        # Configure request headers
-        headers = {
-            'User-Agent': USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-        }
-        
-        # Make request with timeout
-        response = requests.get(
-            url, 
-            headers=headers, 
-            timeout=REQUEST_TIMEOUT,
-            allow_redirects=True
-        )
-        
-        response.raise_for_status()
-        
-        if len(response.content) > MAX_CONTENT_LENGTH:
-            raise ValueError(f"Article content too large: {len(response.content)} bytes (max: {MAX_CONTENT_LENGTH})")
-        
-        content_type = response.headers.get('content-type', '').lower()
-        if 'text/html' not in content_type:
-            raise ValueError(f"Invalid content type: {content_type} (expected HTML)")
-        
-        # Parse HTML with error handling
-        try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-        except Exception as e:
-            raise ValueError(f"Failed to parse HTML content: {str(e)}")
-        
-        error_indicators = [
-            "Wikipedia does not have an article",
-            "The page you requested does not exist",
-            "This page does not exist"
-        ]
-        
-        for indicator in error_indicators:
-            if indicator in response.text:
-                raise ValueError("Wikipedia article not found")
-        
-        # Check for disambiguation pages
-        if (soup.find('div', {'class': 'disambig'}) or 
-            'may refer to:' in response.text or
-            soup.find('div', {'id': 'disambigbox'})):
-            raise ValueError("URL points to a disambiguation page - please use a specific article URL")
-        
-        # Extract title and content
-        try:
-            title = extract_article_title(soup)
-            content = clean_wikipedia_content(soup)
-        except Exception as e:
-            raise ValueError(f"Failed to extract article content: {str(e)}")
-        
-        # Validate extracted content
-        if not title or not title.strip():
-            raise ValueError("Failed to extract article title")
-        
-        if not content or not content.strip():
-            raise ValueError("Failed to extract article content")
+        # Make request with timeout (retries are handled by the session adapter); the body
+        # is streamed so oversized pages are abandoned without being fully downloaded
+        with _SESSION.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, stream=True) as response:
+            response.raise_for_status()
+            html = _read_limited(response)
         
-        if len(content.strip()) < 500:
-            raise ValueError(f"Article content too short for quiz generation ({len(content.strip())} characters, minimum 500)")
+        title, content = _parse_article(html)
         
+        _cache_article(url, (title, content))
         logger.info(f"Successfully scraped article: {title} ({len(content)} characters)")
         
         return title, content
@@ -0,0 +1,62 @@
+"""Tests for the boilerplate-removal paths in scraper.clean_text_content."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import scraper
+
+pytestmark = pytest.mark.skipif(
+    scraper._BOILERPLATE_DB is None, reason="hyperscan is not installed"
+)
+
+FRAGMENTS = [
+    "a", "b", " ", "\n", "\t", ".", "1", "é", "İ", "😀",
+    "Coordinates:", "COORDINATES: 51°N", "coordinates:coordinates:",
+    "This article needs additional citations", "please help improve THIS article",
+    "The examples and perspective in this article", "This article may require cleanup",
+    # Non-ASCII look-alikes that Unicode case folding would match; every path ignores
+    # ASCII case only, so these must be kept
+    "THİS article needs additional citations", "Coordinateſ:", "ＣＯＯＲＤＩＮＡＴＥＳ:",
+]
+
+
+def _regex_fallback(text: str) -> str:
+    return scraper._BOILERPLATE_RE.sub('', text)
+
+
+def test_hyperscan_matches_regex_fallback():
+    rng = random.Random(0)
+    samples = [
+        "",
+        "Plain text without boilerplate.",
+        "Intro. Coordinates: 51°30′N 0°7′W\nLondon is a city.",
+        "This article needs additional citations for verification",
+        "Café. PLEASE HELP IMPROVE THIS ARTICLE by adding sources. Rest",
+        "THİS article needs additional citations x. rest",
+        "Coordinateſ: 51N. rest",
+    ]
+    samples += [
+        "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        for _ in range(5000)
+    ]
+    
+    for text in samples:
+        assert scraper._remove_boilerplate_hyperscan(text) == _regex_fallback(text), repr(text)
+
+
+def test_non_ascii_case_variants_are_kept():
+    for text in ["THİS article needs additional citations x. rest", "Coordinateſ: 51N. rest"]:
+        assert _regex_fallback(text) == text
+        assert scraper._remove_boilerplate_hyperscan(text) == text
+
+
+def test_hyperscan_concurrent_scans_match_regex_fallback():
+    text = "Lorem ipsum. Coordinates: 1 2\nThis article needs additional citations here. Ok " * 5000
+    expected = _regex_fallback(text)
+    
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(scraper._remove_boilerplate_hyperscan, [text] * 64))
+    
+    assert all(result == expected for result in results)